@@ -62,28 +62,29 @@ def do_auto_mode(agent):
         # Give the UI a moment to initialize
         time.sleep(2)
 
+        view = agent.view()
         while True:
             try:
-                logging.info("DEV: Setting bored state with face...")
+                logging.debug("DEV: Setting bored state with face...")
                 agent.set_bored()
-                agent.view().set('status', 'Bored in dev mode...')
-                agent.view().set('name', 'pwnagotchi-dev')
-                agent.view().set('face', faces.BORED)
-                agent.view().update(force=True)
+                view.set('status', 'Bored in dev mode...')
+                view.set('name', 'pwnagotchi-dev')
+                view.set('face', faces.BORED)
+                view.update(force=True)
                 time.sleep(5)
 
-                logging.info("DEV: Setting excited state with face...")
+                logging.debug("DEV: Setting excited state with face...")
                 agent.set_excited()
-                agent.view().set('status', 'Excited!')
-                agent.view().set('face', faces.EXCITED)
-                agent.view().update(force=True)
+                view.set('status', 'Excited!')
+                view.set('face', faces.EXCITED)
+                view.update(force=True)
                 time.sleep(5)
 
-                logging.info("DEV: Setting sad state with face...")
+                logging.debug("DEV: Setting sad state with face...")
                 agent.set_sad()
-                agent.view().set('status', 'Sad...')
-                agent.view().set('face', faces.SAD)
-                agent.view().update(force=True)
+                view.set('status', 'Sad...')
+                view.set('face', faces.SAD)
+                view.update(force=True)
                 time.sleep(5)
             except Exception as e:
                 logging.exception("error in dev mode loop")
@@ -205,7 +206,9 @@ def main():
     else:
         logging.info("DEV_MODE: Skipping hostname setup")
 
-    plugins.load(config)
+    # clearing the display doesn't need any plugin, don't pay for importing them
+    if not args.do_clear:
+        plugins.load(config)
 
     display = Display(config=config, state={'name': '%s>' % pwnagotchi.name()})
 
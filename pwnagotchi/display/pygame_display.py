@@ -2,6 +2,7 @@
 Pygame-based display emulator for round display development.
 This allows local development without physical hardware.
 """
+import os
 import pygame
 import logging
 from PIL import Image
@@ -20,6 +21,9 @@ class PygameDisplay(DisplayImpl):
         self.width = 240
         self.height = 240
         self.screen = None
+        self._last_hash = None
+        # Dumping every frame to disk is only useful when debugging the renderer
+        self._debug_save = bool(os.getenv('PWN_DEBUG_SAVE_PNG'))
 
         logging.info(f"Initializing Pygame display emulator ({self.width}x{self.height})")
 
@@ -68,7 +72,6 @@ class PygameDisplay(DisplayImpl):
 
     def initialize(self):
         """Initialize the pygame display window."""
-        import os
         # Use X11 video driver for VNC display
         os.environ['SDL_VIDEODRIVER'] = 'x11'
         # Disable OpenGL completely
@@ -98,14 +101,15 @@ class PygameDisplay(DisplayImpl):
             logging.warning("render() called with None canvas")
             return
 
-        logging.info(f"render() called with canvas: mode={canvas.mode}, size={canvas.size}")
+        logging.debug("render mode=%s size=%s", canvas.mode, canvas.size)
 
         try:
             # Save canvas for debugging
-            try:
-                canvas.save('/tmp/pwnagotchi_canvas.png')
-            except:
-                pass
+            if self._debug_save:
+                try:
+                    canvas.save('/tmp/pwnagotchi_canvas.png')
+                except:
+                    pass
 
             # Ensure RGB mode
             if canvas.mode != 'RGB':
@@ -113,26 +117,33 @@ class PygameDisplay(DisplayImpl):
 
             # Resize if needed to fit the display
             if canvas.size != (self.width, self.height):
-                canvas = canvas.resize((self.width, self.height), Image.LANCZOS)
+                canvas = canvas.resize((self.width, self.height), Image.BILINEAR)
 
-            # Convert PIL image to pygame surface
-            mode = canvas.mode
-            size = canvas.size
+            # Wrap the raw RGB bytes in a surface without copying them again,
+            # the blit below is the only copy into the window surface
             data = canvas.tobytes()
 
-            py_image = pygame.image.fromstring(data, size, mode)
-            self.screen.blit(py_image, (0, 0))
-            try:
-                pygame.display.flip()
-            except Exception as flip_error:
-                # GL context errors can be ignored - the blit still works
-                if "GL context" not in str(flip_error):
-                    raise
-
-            # Handle pygame events to keep window responsive
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
+            # Most frames are identical to the previous one, skip the blit and flip
+            frame_hash = hash(data)
+            if frame_hash != self._last_hash:
+                self._last_hash = frame_hash
+
+                py_image = pygame.image.frombuffer(data, canvas.size, 'RGB')
+                self.screen.blit(py_image, (0, 0))
+                try:
+                    pygame.display.flip()
+                except Exception as flip_error:
+                    # GL context errors can be ignored - the blit still works
+                    if "GL context" not in str(flip_error):
+                        raise
+
+            # Handle pygame events to keep window responsive, without building
+            # Python event objects for every mouse motion coming from VNC
+            pygame.event.pump()
+            if pygame.event.peek(pygame.QUIT):
+                pygame.quit()
+            else:
+                pygame.event.clear()
 
         except Exception as e:
             logging.error(f"Error rendering to pygame display: {e}")
@@ -140,6 +151,7 @@ class PygameDisplay(DisplayImpl):
     def clear(self):
         """Clear the display to black."""
         if self.screen:
+            self._last_hash = None
             self.screen.fill((0, 0, 0))  # Black background
             pygame.display.flip()
 
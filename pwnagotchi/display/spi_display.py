@@ -20,6 +20,7 @@ class SPIDisplay(DisplayImpl):
         self.height = 240
         self.spi_speed_hz = 60000000
         self.device = None
+        self._blank = None
 
         logging.info(f"Initializing SPI round display ({self.width}x{self.height})")
 
@@ -83,7 +84,7 @@ class SPIDisplay(DisplayImpl):
 
             # Resize if needed
             if canvas.size != (self.width, self.height):
-                canvas = canvas.resize((self.width, self.height), Image.LANCZOS)
+                canvas = canvas.resize((self.width, self.height), Image.BILINEAR)
 
             # TODO: Send to actual hardware
             # if self.device:
@@ -97,9 +98,10 @@ class SPIDisplay(DisplayImpl):
     def clear(self):
         """Clear the display."""
         try:
-            # Create a white image and display it
-            blank = Image.new('RGB', (self.width, self.height), 'white')
-            self.render(blank)
+            # Create a white image once and display it
+            if self._blank is None:
+                self._blank = Image.new('RGB', (self.width, self.height), 'white')
+            self.render(self._blank)
         except Exception as e:
             logging.error(f"Error clearing SPI display: {e}")
 
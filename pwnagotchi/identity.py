@@ -2,9 +2,11 @@ from Crypto.Signature import PKCS1_PSS
 from Crypto.PublicKey import RSA
 import Crypto.Hash.SHA256 as SHA256
 import base64
+import binascii
 import hashlib
 import os
 import shutil
+import subprocess
 import logging
 
 DefaultPath = "/etc/pwnagotchi/"
@@ -15,9 +17,12 @@ class KeyPair(object):
         self.path = path
         self.priv_path = os.path.join(path, "id_rsa")
         self.priv_key = None
+        self._signer = None
         self.pub_path = "%s.pub" % self.priv_path
         self.pub_key = None
         self.fingerprint_path = os.path.join(path, "fingerprint")
+        self.pub_b64_path = os.path.join(path, "pub.b64")
+        self.stamp_path = os.path.join(path, "keys.stamp")
         self._view = view
 
         if not os.path.exists(self.path):
@@ -31,7 +36,7 @@ class KeyPair(object):
                 logging.info("generating %s ..." % self.priv_path)
                 # try pwngrid first, fall back to native Python key generation
                 if shutil.which("pwngrid"):
-                    ret = os.system("pwngrid -generate -keys '%s'" % self.path)
+                    ret = subprocess.run(['pwngrid', '-generate', '-keys', self.path], check=False).returncode
                     if ret != 0 or not os.path.exists(self.priv_path):
                         logging.warning("pwngrid failed, generating RSA keys with Python ...")
                         self._generate_keys_native()
@@ -42,24 +47,7 @@ class KeyPair(object):
             # load keys: they might be corrupted if the unit has been turned off during the generation, in this case
             # the exception will remove the files and go back at the beginning of this loop.
             try:
-                with open(self.priv_path) as fp:
-                    self.priv_key = RSA.importKey(fp.read())
-
-                with open(self.pub_path) as fp:
-                    self.pub_key = RSA.importKey(fp.read())
-                    self.pub_key_pem = self.pub_key.exportKey('PEM').decode("ascii")
-                    # python is special
-                    if 'RSA PUBLIC KEY' not in self.pub_key_pem:
-                        self.pub_key_pem = self.pub_key_pem.replace('PUBLIC KEY', 'RSA PUBLIC KEY')
-
-                pem_ascii = self.pub_key_pem.encode("ascii")
-
-                self.pub_key_pem_b64 = base64.b64encode(pem_ascii).decode("ascii")
-                self.fingerprint = hashlib.sha256(pem_ascii).hexdigest()
-
-                with open(self.fingerprint_path, 'w+t') as fp:
-                    fp.write(self.fingerprint)
-
+                self._load_keys()
                 # no exception, keys loaded correctly.
                 self._view.on_starting()
                 return
@@ -78,25 +66,88 @@ class KeyPair(object):
 
         # exhausted retries — generate with Python as last resort
         logging.error("failed to load keys after %d attempts, generating fresh keys with Python ..." % max_retries)
-        self._generate_keys_native()
         try:
-            with open(self.priv_path) as fp:
-                self.priv_key = RSA.importKey(fp.read())
-            with open(self.pub_path) as fp:
-                self.pub_key = RSA.importKey(fp.read())
-                self.pub_key_pem = self.pub_key.exportKey('PEM').decode("ascii")
-                if 'RSA PUBLIC KEY' not in self.pub_key_pem:
-                    self.pub_key_pem = self.pub_key_pem.replace('PUBLIC KEY', 'RSA PUBLIC KEY')
-            pem_ascii = self.pub_key_pem.encode("ascii")
-            self.pub_key_pem_b64 = base64.b64encode(pem_ascii).decode("ascii")
-            self.fingerprint = hashlib.sha256(pem_ascii).hexdigest()
-            with open(self.fingerprint_path, 'w+t') as fp:
-                fp.write(self.fingerprint)
+            self._generate_keys_native()
+            self._load_keys()
             self._view.on_starting()
         except Exception as e:
             logging.exception("fatal: could not generate or load RSA keys")
             raise
 
+    def _load_keys(self):
+        """Load the key pair and derive pub_key_pem_b64 and fingerprint, raises if the keys are unusable."""
+        with open(self.priv_path) as fp:
+            self.priv_key = RSA.importKey(fp.read())
+            self._signer = PKCS1_PSS.new(self.priv_key, saltLen=16)
+
+        # the public key hasn't changed since last boot, skip parsing and hashing it again
+        if self._load_derived():
+            return
+
+        with open(self.pub_path) as fp:
+            self.pub_key = RSA.importKey(fp.read())
+            self.pub_key_pem = self.pub_key.exportKey('PEM').decode("ascii")
+            # python is special
+            if 'RSA PUBLIC KEY' not in self.pub_key_pem:
+                self.pub_key_pem = self.pub_key_pem.replace('PUBLIC KEY', 'RSA PUBLIC KEY')
+
+        pem_ascii = self.pub_key_pem.encode("ascii")
+
+        self.pub_key_pem_b64 = base64.b64encode(pem_ascii).decode("ascii")
+        # must stay SHA-256: this is the unit identity pwngrid advertises and verifies
+        self.fingerprint = hashlib.sha256(pem_ascii).hexdigest()
+
+        self._write_atomic(self.fingerprint_path, self.fingerprint)
+
+        self._save_derived()
+
+    def _keys_stamp(self):
+        return "%d:%d" % (os.stat(self.priv_path).st_mtime_ns, os.stat(self.pub_path).st_mtime_ns)
+
+    def _load_derived(self):
+        """Load pub_key_pem_b64 and fingerprint saved by a previous boot if the keys are unchanged."""
+        try:
+            with open(self.stamp_path) as fp:
+                if fp.read().strip() != self._keys_stamp():
+                    return False
+            with open(self.pub_b64_path) as fp:
+                self.pub_key_pem_b64 = fp.read().strip()
+            with open(self.fingerprint_path) as fp:
+                self.fingerprint = fp.read().strip()
+        except Exception:
+            return False
+
+        if not self.pub_key_pem_b64 or len(self.fingerprint) != 64:
+            return False
+
+        try:
+            int(self.fingerprint, 16)
+            pem_ascii = base64.b64decode(self.pub_key_pem_b64, validate=True)
+            self.pub_key_pem = pem_ascii.decode("ascii")
+        except (ValueError, binascii.Error, UnicodeDecodeError):
+            return False
+
+        # a damaged cache must fall back to the key files, never look like corrupted keys
+        return hashlib.sha256(pem_ascii).hexdigest() == self.fingerprint
+
+    def _save_derived(self):
+        try:
+            self._write_atomic(self.pub_b64_path, self.pub_key_pem_b64)
+            # written last, a stamp only ever sits next to complete files
+            self._write_atomic(self.stamp_path, self._keys_stamp())
+        except Exception as e:
+            logging.warning("could not save derived key data: %s" % e)
+
+    @staticmethod
+    def _write_atomic(path, data):
+        # a power loss while writing leaves either the old or the new file, never half of one
+        tmp_path = "%s.tmp" % path
+        with open(tmp_path, 'w+t') as fp:
+            fp.write(data)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, path)
+
     def _generate_keys_native(self):
         """Generate RSA key pair using PyCryptodome when pwngrid is not available."""
         key = RSA.generate(2048)
@@ -108,8 +159,7 @@ class KeyPair(object):
         logging.info("RSA keys generated natively at %s" % self.priv_path)
 
     def sign(self, message):
-        hasher = SHA256.new(message.encode("ascii"))
-        signer = PKCS1_PSS.new(self.priv_key, saltLen=16)
-        signature = signer.sign(hasher)
+        hasher = SHA256.new(message if isinstance(message, bytes) else message.encode("ascii"))
+        signature = self._signer.sign(hasher)
         signature_b64 = base64.b64encode(signature).decode("ascii")
         return signature, signature_b64
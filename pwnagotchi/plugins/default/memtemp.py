@@ -30,6 +30,24 @@ import pwnagotchi.ui.fonts as fonts
 import pwnagotchi.plugins as plugins
 import pwnagotchi
 import logging
+import os
+import time
+
+
+def _ttl(fn, seconds=2):
+    """Cache the result of a no-argument callable for a few seconds."""
+    cache = {}
+
+    def wrapper():
+        now = time.monotonic()
+        hit = cache.get('v')
+        if hit is not None and now - hit[0] < seconds:
+            return hit[1]
+        result = fn()
+        cache['v'] = (now, result)
+        return result
+
+    return wrapper
 
 
 class MemTemp(plugins.Plugin):
@@ -49,6 +67,12 @@ class MemTemp(plugins.Plugin):
     LABEL_SPACING = 0
     FIELD_WIDTH = 4
 
+    def __init__(self):
+        self._freq_fd = None
+        # /proc and sysfs values don't move fast enough to be worth re-reading every ui tick
+        for getter in self.ALLOWED_FIELDS.values():
+            setattr(self, getter, _ttl(getattr(self, getter)))
+
     def on_loaded(self):
         logging.info("memtemp plugin loaded.")
 
@@ -72,11 +96,13 @@ class MemTemp(plugins.Plugin):
         return f"{temp}{symbol}"
 
     def cpu_freq(self):
-        with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq', 'rt') as fp:
-            return f"{round(float(fp.readline())/1000000, 1)}G"
+        # keep the sysfs file open, it can be re-read from offset 0 on every tick
+        if self._freq_fd is None:
+            self._freq_fd = os.open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq', os.O_RDONLY)
+        return f"{round(int(os.pread(self._freq_fd, 16, 0)) / 1000000, 1)}G"
 
     def pad_text(self, data):
-        return " " * (self.FIELD_WIDTH - len(data)) + data
+        return data.rjust(self.FIELD_WIDTH)
 
     def on_ui_setup(self, ui):
         try:
@@ -88,6 +114,10 @@ class MemTemp(plugins.Plugin):
             # Set default value
             self.fields = self.DEFAULT_FIELDS
 
+        # resolve the field getters once instead of on every ui update
+        self._field_fns = [(name, getattr(self, self.ALLOWED_FIELDS[name])) for name in self.fields]
+        self._last_data = None
+
         # Single CurvedText on the right side, just inside uptime
         ui.add_element(
             'memtemp',
@@ -104,7 +134,13 @@ class MemTemp(plugins.Plugin):
     def on_unload(self, ui):
         with ui._lock:
             ui.remove_element('memtemp')
+        if self._freq_fd is not None:
+            os.close(self._freq_fd)
+            self._freq_fd = None
 
     def on_ui_update(self, ui):
-        data = " ".join([f"{x}:{getattr(self, self.ALLOWED_FIELDS[x])()}" for x in self.fields])
-        ui.set('memtemp', data)
+        data = " ".join(f"{name}:{fn()}" for name, fn in self._field_fns)
+        # readings are cached for a couple of seconds, most ticks produce the same text
+        if data != self._last_data:
+            self._last_data = data
+            ui.set('memtemp', data)
@@ -6,7 +6,7 @@ Custom additions for round display:
   - Text: Extended with 'image' parameter for PNG face support
   - CurvedText: Draws text along a circular arc (for round LCD layout)
 """
-from PIL import Image
+from PIL import Image, ImageDraw
 from textwrap import TextWrapper
 import math
 
@@ -14,6 +14,67 @@ import math
 # Upstream used 0 (black on white e-paper). Overridden per-component in view.py.
 DEFAULT_COLOR = (255, 255, 255)
 
+# Mode of the canvas View draws on; bitmaps are converted to it once so paste() is a plain copy
+TARGET_MODE = 'RGB'
+
+# Per-character (advance, width, height) keyed by (char, font), shared by all CurvedText widgets
+_CHAR_METRICS = {}
+
+
+def _char_metrics(char, font, drawer):
+    """Measure a single character, caching the result for the life of the process."""
+    key = (char, font)
+    metrics = _CHAR_METRICS.get(key)
+    if metrics is None:
+        try:
+            char_width = drawer.textlength(char, font=font)
+        except:
+            char_width = 6
+
+        try:
+            bbox = drawer.textbbox((0, 0), char, font=font)
+            char_w = bbox[2] - bbox[0]
+            char_h = bbox[3] - bbox[1]
+        except:
+            char_w = int(char_width)
+            char_h = 12
+
+        metrics = _CHAR_METRICS[key] = (char_width, char_w, char_h)
+    return metrics
+
+
+# Rotated glyph tiles keyed by (char, font, color, angle); angles are quantized so the set stays small
+_GLYPH_ATLAS = {}
+GLYPH_ANGLE_STEP = 2
+GLYPH_ATLAS_MAX = 2048
+GLYPH_PADDING = 20
+# Glyphs are ~20px, where bilinear looks the same as bicubic at a quarter of the kernel taps
+GLYPH_RESAMPLE = Image.BILINEAR
+
+
+def _rotated_glyph(char, font, color, angle, char_w, char_h):
+    """Return the RGBA tile for a character rotated by angle degrees, rendering it on first use."""
+    angle = int(round(angle / GLYPH_ANGLE_STEP)) * GLYPH_ANGLE_STEP % 360
+    key = (char, font, color, angle)
+    glyph = _GLYPH_ATLAS.get(key)
+    if glyph is None:
+        # Create small image for rotated character
+        padding = GLYPH_PADDING
+        char_img = Image.new('RGBA', (char_w + padding, char_h + padding), (0, 0, 0, 0))
+        char_drawer = ImageDraw.Draw(char_img)
+
+        # Draw character in center of temp image
+        char_drawer.text((padding // 2, padding // 2), char, font=font, fill=color)
+
+        glyph = char_img.rotate(-angle, expand=True, resample=GLYPH_RESAMPLE)
+        glyph.load()
+
+        # values like the uptime keep producing new (char, angle) pairs, don't grow forever
+        if len(_GLYPH_ATLAS) >= GLYPH_ATLAS_MAX:
+            _GLYPH_ATLAS.clear()
+        _GLYPH_ATLAS[key] = glyph
+    return glyph
+
 
 class Widget(object):
     def __init__(self, xy, color=DEFAULT_COLOR):
@@ -28,6 +89,10 @@ class Bitmap(Widget):
     def __init__(self, path, xy, color=DEFAULT_COLOR):
         super().__init__(xy, color)
         self.image = Image.open(path)
+        if self.image.mode != TARGET_MODE:
+            self.image = self.image.convert(TARGET_MODE)
+        else:
+            self.image.load()
 
     def draw(self, canvas, drawer):
         canvas.paste(self.image, self.xy)
@@ -67,30 +132,42 @@ class Text(Widget):
         self.max_length = max_length
         self.image = image          # Current frame (PIL Image) for face rendering
         self._frames = []           # All frames for animated faces (APNG)
+        self._layers = []           # Optional cropped (x, y, RGB image, alpha mask) per frame, pasted instead of the RGBA frame
         self._frame_index = 0       # Current frame index for animation
         self.wrapper = TextWrapper(width=self.max_length, replace_whitespace=False) if wrap else None
+        self._wrapped_cache = (None, None)  # (value, wrapped text) from the last wrapped draw
 
-    def set_frames(self, frames):
+    def set_frames(self, frames, layers=None):
         """Set animation frames for this text widget.
 
         Args:
             frames: List of PIL Image objects. If len > 1, the face is animated
                     and draw() will cycle through frames automatically.
+            layers: Optional list of (x offset, y offset, RGB image, alpha mask) tuples
+                    matching frames, see faces_img.get_face_layers().
         """
         self._frames = frames if frames else []
+        self._layers = layers if layers and len(layers) == len(self._frames) else []
         self._frame_index = 0
         self.image = self._frames[0] if self._frames else None
 
     def draw(self, canvas, drawer):
         # Animated face: cycle to next frame on each draw
+        layer = 0
         if self._frames and len(self._frames) > 1:
-            self.image = self._frames[self._frame_index]
-            self._frame_index = (self._frame_index + 1) % len(self._frames)
+            layer = self._frame_index
+            self.image = self._frames[layer]
+            self._frame_index = (layer + 1) % len(self._frames)
 
         # If an image is set, draw it instead of text
         if self.image is not None:
             try:
-                canvas.paste(self.image, self.xy, self.image if self.image.mode == 'RGBA' else None)
+                if self._layers and self.image is self._frames[layer]:
+                    if self._layers[layer] is not None:
+                        dx, dy, rgb, mask = self._layers[layer]
+                        canvas.paste(rgb, (self.xy[0] + dx, self.xy[1] + dy), mask)
+                else:
+                    canvas.paste(self.image, self.xy, self.image if self.image.mode == 'RGBA' else None)
                 return
             except Exception as e:
                 # Fall back to text if image fails
@@ -98,12 +175,40 @@ class Text(Widget):
 
         if self.value is not None:
             if self.wrap:
-                text = '\n'.join(self.wrapper.wrap(self.value))
+                if self._wrapped_cache[0] == self.value:
+                    text = self._wrapped_cache[1]
+                else:
+                    text = '\n'.join(self.wrapper.wrap(self.value))
+                    self._wrapped_cache = (self.value, text)
             else:
                 text = self.value
             drawer.text(self.xy, text, font=self.font, fill=self.color)
 
 
+# Pre-rendered RGBA label bitmaps keyed by (label, font, color); labels are static so this stays small
+_LABEL_CACHE = {}
+
+
+def _label_mask(label, font, start, fontmode, drawer):
+    """Return (coverage mask, x offset, y offset) for a label, rasterizing it on first use.
+
+    The mask is drawn with the same fractional start and font mode drawer.text()
+    would use, so pasting the ink through it gives the same pixels for any color.
+    """
+    key = (label, font, start, fontmode)
+    entry = _LABEL_CACHE.get(key)
+    if entry is None:
+        left, top, right, bottom = drawer.textbbox((0, 0), label, font=font)
+        ox, oy = -min(left, 0), -min(top, 0)
+        # one spare pixel each way for glyphs nudged by the fractional start
+        mask = Image.new('L', (right + ox + 2, bottom + oy + 2), 0)
+        mask_drawer = ImageDraw.Draw(mask)
+        mask_drawer.fontmode = fontmode
+        mask_drawer.text((ox + start[0], oy + start[1]), label, font=font, fill=255)
+        entry = _LABEL_CACHE[key] = (mask, ox, oy)
+    return entry
+
+
 class LabeledValue(Widget):
     def __init__(self, label, value="", position=(0, 0), label_font=None, text_font=None, color=DEFAULT_COLOR, label_spacing=5):
         super().__init__(position, color)
@@ -118,7 +223,15 @@ class LabeledValue(Widget):
             drawer.text(self.xy, self.value, font=self.label_font, fill=self.color)
         else:
             pos = self.xy
-            drawer.text(pos, self.label, font=self.label_font, fill=self.color)
+            x, y = pos
+            if x >= 0 and y >= 0:
+                # same integer/fractional split as drawer.text()
+                start = (math.modf(x)[0], math.modf(y)[0])
+                mask, ox, oy = _label_mask(self.label, self.label_font, start, drawer.fontmode, drawer)
+                x, y = int(x) - ox, int(y) - oy
+                canvas.paste(self.color, (x, y, x + mask.width, y + mask.height), mask)
+            else:
+                drawer.text(pos, self.label, font=self.label_font, fill=self.color)
             drawer.text((pos[0] + self.label_spacing + 5 * len(self.label), pos[1]), self.value, font=self.text_font, fill=self.color)
 
 
@@ -140,17 +253,70 @@ class CurvedText(Widget):
         self.start_angle = start_angle
         self.font = font
         self.flip = flip
+        self._cache_key = None      # Parameters the cached glyphs were rendered with
+        self._strip = None          # Cached (x, y, RGB image, alpha mask) of all characters composited together
 
     def draw(self, canvas, drawer):
         if not self.value or self.font is None:
             return
 
-        from PIL import ImageDraw
+        # Measuring, rasterizing and rotating every glyph is the expensive part,
+        # only redo it when something that affects the result has changed
+        key = (self.value, self.font, self.center, self.radius, self.start_angle, self.flip, self.color, canvas.size)
+        if key != self._cache_key:
+            glyphs = self._layout_glyphs(drawer, canvas.width, canvas.height)
+            self._strip = self._composite(glyphs, canvas.width, canvas.height)
+            self._cache_key = key
+
+        # One masked paste for the whole arc instead of one per character
+        if self._strip is not None:
+            x, y, rgb, mask = self._strip
+            canvas.paste(rgb, (x, y), mask)
+
+    @staticmethod
+    def _composite(glyphs, width, height):
+        """Flatten the rotated characters into a single image clipped to the canvas.
+
+        Returns:
+            (x, y, RGB image, alpha mask) tuple, or None if nothing is visible
+        """
+        # Keep only characters with some part within the canvas
+        glyphs = [(px, py, rotated) for px, py, rotated in glyphs
+                  if px + rotated.width > 0 and py + rotated.height > 0 and px < width and py < height]
+        if not glyphs:
+            return None
+
+        x0 = max(0, min(px for px, _, _ in glyphs))
+        y0 = max(0, min(py for _, py, _ in glyphs))
+        x1 = min(width, max(px + rotated.width for px, _, rotated in glyphs))
+        y1 = min(height, max(py + rotated.height for _, py, rotated in glyphs))
+
+        strip = Image.new('RGBA', (x1 - x0, y1 - y0), (0, 0, 0, 0))
+        for px, py, rotated in glyphs:
+            # alpha_composite() wants the source box inside the destination, crop what hangs off the canvas
+            sx, sy = max(0, x0 - px), max(0, y0 - py)
+            src = (sx, sy, min(rotated.width, x1 - px), min(rotated.height, y1 - py))
+            strip.alpha_composite(rotated, (px + sx - x0, py + sy - y0), src)
+
+        # Trim the transparent padding around the rotated tiles
+        bbox = strip.getchannel('A').getbbox()
+        if bbox is None:
+            return None
+        strip = strip.crop(bbox)
+        return x0 + bbox[0], y0 + bbox[1], strip.convert('RGB'), strip.getchannel('A')
+
+    def _layout_glyphs(self, drawer, width, height):
+        """Render the rotated characters of the current value that can land on a width x height canvas.
+
+        Returns:
+            List of (paste_x, paste_y, rotated_image) tuples, one per character
+        """
+        glyphs = []
 
         # Convert value to string and strip any newlines for single-line display
         text = str(self.value).replace('\n', ' ').strip()
         if not text:
-            return
+            return glyphs
 
         # Calculate total text width to center it on the arc
         try:
@@ -158,55 +324,48 @@ class CurvedText(Widget):
         except:
             total_width = len(text) * 6
 
-        angle_span = (total_width / self.radius) * (180 / math.pi)
+        # Local bindings for the per-character loop
+        cos = math.cos
+        hypot = math.hypot
+        sin = math.sin
+        radians = math.radians
+        deg_per_px = (180 / math.pi) / self.radius
+        cx, cy = self.center
+        radius = self.radius
+        font = self.font
+        color = self.color
+        rotation_offset = -90 if self.flip else 90
+
+        angle_span = total_width * deg_per_px
 
         # Direction: clockwise (normal) or counter-clockwise (flipped)
         direction = -1 if self.flip else 1
         current_angle = self.start_angle - direction * (angle_span / 2)
 
         for char in text:
-            # Calculate character width
-            try:
-                char_width = drawer.textlength(char, font=self.font)
-            except:
-                char_width = 6
-
-            # Get character dimensions
-            try:
-                bbox = drawer.textbbox((0, 0), char, font=self.font)
-                char_h = bbox[3] - bbox[1]
-                char_w = bbox[2] - bbox[0]
-            except:
-                char_h = 12
-                char_w = int(char_width)
+            # Character advance and dimensions
+            char_width, char_w, char_h = _char_metrics(char, font, drawer)
 
             # Calculate position on the circle
-            angle_rad = math.radians(current_angle)
-            x = self.center[0] + self.radius * math.cos(angle_rad)
-            y = self.center[1] + self.radius * math.sin(angle_rad)
-
-            # Create small image for rotated character
-            padding = 20
-            char_img = Image.new('RGBA', (char_w + padding, char_h + padding), (0, 0, 0, 0))
-            char_drawer = ImageDraw.Draw(char_img)
+            angle_rad = radians(current_angle)
+            x = cx + radius * cos(angle_rad)
+            y = cy + radius * sin(angle_rad)
 
-            # Draw character in center of temp image
-            char_drawer.text((padding // 2, padding // 2), char, font=self.font, fill=self.color)
+            # Skip characters that can't reach the canvas before rasterizing them, the
+            # rotated tile is never wider than the diagonal of the padded glyph
+            reach = hypot(char_w + GLYPH_PADDING, char_h + GLYPH_PADDING) / 2 + 1
+            if x + reach < 0 or y + reach < 0 or x - reach >= width or y - reach >= height:
+                current_angle += direction * char_width * deg_per_px
+                continue
 
             # Normal: bottom of char points toward center (+90°)
             # Flipped: top of char points toward center (-90°), for bottom-half readability
-            rotation_angle = current_angle + (90 if not self.flip else -90)
-            rotated = char_img.rotate(-rotation_angle, expand=True, resample=Image.BICUBIC)
+            rotation_angle = current_angle + rotation_offset
+            rotated = _rotated_glyph(char, font, color, rotation_angle, char_w, char_h)
 
-            # Paste rotated character onto main canvas
-            paste_x = int(x - rotated.width / 2)
-            paste_y = int(y - rotated.height / 2)
-
-            # Paste if any part of the character is within the canvas
-            if (paste_x + rotated.width > 0 and paste_y + rotated.height > 0
-                    and paste_x < canvas.width and paste_y < canvas.height):
-                canvas.paste(rotated, (paste_x, paste_y), rotated)
+            glyphs.append((int(x - rotated.width / 2), int(y - rotated.height / 2), rotated))
 
             # Move to next character position (counter-clockwise if flipped)
-            char_angle_span = (char_width / self.radius) * (180 / math.pi)
-            current_angle += direction * char_angle_span
+            current_angle += direction * char_width * deg_per_px
+
+        return glyphs
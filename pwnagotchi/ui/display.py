@@ -4,6 +4,7 @@ import threading
 
 import pwnagotchi.plugins as plugins
 import pwnagotchi.ui.hw as hw
+import pwnagotchi.ui.web as web
 from pwnagotchi.ui.view import View
 
 
@@ -113,6 +114,9 @@ class Display(View):
     def _on_view_rendered(self, img):
         try:
             if self._config['ui']['web']['on_frame'] != '':
+                # the hook may read the frame file, which is otherwise only written on request
+                with web.frame_lock:
+                    web.flush_frame()
                 os.system(self._config['ui']['web']['on_frame'])
         except Exception as e:
             logging.error("%s" % e)
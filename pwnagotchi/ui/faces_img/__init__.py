@@ -12,14 +12,62 @@ To add custom face images:
 5. For animated faces, save as APNG with multiple frames
 """
 
+import functools
 import logging
 import os
-from PIL import Image
+import time
+from PIL import Image, ImageSequence, __version__ as PIL_VERSION
 
 FACES_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Pillow >= 9.1 (and Pillow-SIMD 9) moved the filters to Image.Resampling
+_RESAMPLING = getattr(Image, 'Resampling', Image)
+_RESAMPLE_FILTERS = {
+    'NEAREST': _RESAMPLING.NEAREST,
+    'BILINEAR': _RESAMPLING.BILINEAR,
+    'BICUBIC': _RESAMPLING.BICUBIC,
+    'LANCZOS': _RESAMPLING.LANCZOS,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _face_resample():
+    """Resampling filter used when a face file isn't already at the requested size.
+
+    Named by PWN_FACE_RESAMPLE (for faster cold boots), LANCZOS when unset or
+    unknown. Resolved on first use rather than at import, which happens before
+    logging is set up, so a bad value gets its warning into the pwnagotchi log.
+    """
+    name = (os.environ.get('PWN_FACE_RESAMPLE') or 'LANCZOS').upper()
+    if name not in _RESAMPLE_FILTERS:
+        logging.warning("[FACE] unknown PWN_FACE_RESAMPLE '%s', using LANCZOS", name)
+        name = 'LANCZOS'
+    return _RESAMPLE_FILTERS[name]
+
+
+def _scan_faces():
+    """Names of the face PNGs in FACES_DIR, read once instead of stat()ing on every lookup."""
+    try:
+        return {f[:-4] for f in os.listdir(FACES_DIR) if f.endswith('.png')}
+    except OSError as e:
+        logging.error(f"Error listing face images in {FACES_DIR}: {e}")
+        return set()
+
+
+_available = _scan_faces()
+
+
+@functools.lru_cache(maxsize=128)
+def _face_path(face_name):
+    """Return (lowercased name, PNG path) for a face name."""
+    name = face_name.lower()
+    return name, os.path.join(FACES_DIR, f"{name}.png")
+
+
 # Cache loaded faces to avoid re-reading from disk every time
 _face_cache = {}
+# Cache of (x offset, y offset, RGB image, alpha mask) per face frame, ready to be pasted
+_layer_cache = {}
 
 
 def _extract_frames(img, size):
@@ -32,16 +80,15 @@ def _extract_frames(img, size):
     Returns:
         List of PIL Image frames (RGBA mode, resized)
     """
+    resample = _face_resample()
     frames = []
     try:
-        n_frames = getattr(img, 'n_frames', 1)
-        for i in range(n_frames):
-            img.seek(i)
-            frame = img.copy()
-            if frame.mode != 'RGBA':
-                frame = frame.convert('RGBA')
+        # single forward pass over the frames; the iterator yields img itself
+        # seeked to each frame, convert() gives every frame its own buffer
+        for frame in ImageSequence.Iterator(img):
+            frame = frame.convert('RGBA')
             if frame.size != size:
-                frame = frame.resize(size, Image.LANCZOS)
+                frame = frame.resize(size, resample)
             frames.append(frame)
     except EOFError:
         pass
@@ -52,7 +99,7 @@ def _extract_frames(img, size):
         if frame.mode != 'RGBA':
             frame = frame.convert('RGBA')
         if frame.size != size:
-            frame = frame.resize(size, Image.LANCZOS)
+            frame = frame.resize(size, resample)
         frames.append(frame)
 
     return frames
@@ -85,33 +132,89 @@ def get_face_frames(face_name, size=(160, 160)):
     Returns:
         List of PIL Image frames, or empty list if image doesn't exist
     """
-    cache_key = (face_name.lower(), size)
+    name, face_path = _face_path(face_name)
+    cache_key = (name, size)
     if cache_key in _face_cache:
         return _face_cache[cache_key]
 
-    face_path = os.path.join(FACES_DIR, f"{face_name.lower()}.png")
-    if not os.path.exists(face_path):
+    if name not in _available:
         return []
 
     try:
-        img = Image.open(face_path)
-        frames = _extract_frames(img, size)
+        # open() is the only filesystem access here, the directory listing already said the file exists
+        with Image.open(face_path) as img:
+            # lets decoders that support it (JPEG) decode at reduced scale, no-op for PNG
+            img.draft(None, size)
+            frames = _extract_frames(img, size)
         n = len(frames)
         if n > 1:
             logging.info(f"[FACE] Loaded animated face '{face_name}': {n} frames")
         _face_cache[cache_key] = frames
         return frames
+    except FileNotFoundError:
+        # removed since the directory was scanned, don't try again
+        _available.discard(name)
+        return []
     except Exception as e:
         logging.error(f"Error loading face image {face_name}: {e}")
         return []
 
 
+def get_face_layers(face_name, size=(160, 160)):
+    """Load all frames for a face split into color and alpha, ready for paste().
+
+    Splitting once here spares Image.paste() from extracting the alpha
+    channel of an RGBA frame on every draw. Each frame is also cropped to
+    its non-transparent area, since the canvas is redrawn from scratch and
+    fully transparent pixels would paste nothing.
+
+    Args:
+        face_name: Name of the face (e.g., 'happy', 'sad', 'excited')
+        size: Tuple of (width, height) to resize each frame to
+
+    Returns:
+        List of (x offset, y offset, RGB image, L mask) tuples, or None for a
+        fully transparent frame; empty list if image doesn't exist
+    """
+    cache_key = (_face_path(face_name)[0], size)
+    if cache_key in _layer_cache:
+        return _layer_cache[cache_key]
+
+    frames = get_face_frames(face_name, size)
+    if not frames:
+        return []
+
+    layers = []
+    for frame in frames:
+        bbox = frame.getchannel('A').getbbox()
+        if bbox is None:
+            layers.append(None)
+            continue
+        crop = frame.crop(bbox)
+        layers.append((bbox[0], bbox[1], crop.convert('RGB'), crop.getchannel('A')))
+    _layer_cache[cache_key] = layers
+    return layers
+
+
+def preload_all(size=(160, 160)):
+    """Decode every face in FACES_DIR into the caches ahead of its first use."""
+    # Pillow-SIMD reports versions like "9.0.0.post1", this tells which build renders
+    # the UI; logged here since importing this module happens before logging is set up
+    logging.info("[FACE] using PIL %s", PIL_VERSION)
+    started = time.time()
+    for name in list(_available):
+        get_face_layers(name, size)
+    logging.debug("[FACE] preloaded %d faces in %.2fs", len(_available), time.time() - started)
+
+
 def has_face_image(face_name):
     """Check if a face image exists."""
-    face_path = os.path.join(FACES_DIR, f"{face_name.lower()}.png")
-    return os.path.exists(face_path)
+    return _face_path(face_name)[0] in _available
 
 
 def clear_cache():
     """Clear the face image cache (e.g., after replacing image files)."""
+    global _available
+    _available = _scan_faces()
     _face_cache.clear()
+    _layer_cache.clear()
@@ -10,9 +10,14 @@ Design (from reference art):
   - Cool: oversized dark sunglasses with cyan frame and highlight dots
   - Hearts: cyan gradient hearts
   - No face outline – floating features on transparent background
+
+Only stock Pillow APIs are used, so Pillow-SIMD works as a drop-in replacement
+for faster blur/composite on x86 (pip uninstall pillow && pip install pillow-simd).
 """
 
 from PIL import Image, ImageDraw, ImageFilter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import hashlib
 import os
 import math
 
@@ -47,18 +52,37 @@ def _ellipse(draw, cx, cy, rx, ry, fill):
     draw.ellipse([cx - rx, cy - ry, cx + rx, cy + ry], fill=fill)
 
 
+def _draw(img):
+    """Draw handle for img, created once and reused by every helper drawing on it."""
+    draw = getattr(img, '_face_draw', None)
+    if draw is None:
+        draw = img._face_draw = ImageDraw.Draw(img)
+    return draw
+
+
+def _layer(img, cx, cy, rx, ry):
+    """Transparent temp layer just big enough for a feature centred on (cx, cy).
+
+    Returns (layer, ox, oy); draw on it at coordinates shifted by (-ox, -oy)
+    and composite back with img.alpha_composite(layer, (ox, oy)).
+    """
+    ox, oy = max(0, cx - rx - 1), max(0, cy - ry - 1)
+    w = min(img.width, cx + rx + 2) - ox
+    h = min(img.height, cy + ry + 2) - oy
+    return Image.new('RGBA', (w, h), (0, 0, 0, 0)), ox, oy
+
+
 def _soft_edge(img, radius=1.2):
     """Very subtle anti-alias softening."""
     blurred = img.filter(ImageFilter.GaussianBlur(radius))
-    out = Image.alpha_composite(Image.new('RGBA', img.size, (0, 0, 0, 0)), blurred)
-    return Image.alpha_composite(out, img)
+    return Image.alpha_composite(blurred, img)
 
 
 # ── Eye drawing ─────────────────────────────────────────────────────────────
 
 def _draw_eye(img, cx, cy, r=EYE_R):
     """Full round cartoon eye: cyan ring + dark centre + white highlight."""
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     # Outer ring (sclera) – cyan
     _circle(draw, cx, cy, r, CYAN)
     # Thin darker ring for depth
@@ -75,62 +99,75 @@ def _draw_eye(img, cx, cy, r=EYE_R):
     _circle(draw, hx, hy, hr, WHITE)
 
 
+def _cut_offset(r, angle):
+    angle_rad = math.radians(angle)
+    return int(r * 1.5 * math.cos(angle_rad)), int(r * 1.5 * math.sin(angle_rad))
+
+
+# Eyelid cut offsets for the default eye at the angles FACES uses, worked out once
+_CUT_DXY = {angle: _cut_offset(EYE_R, angle) for angle in (-20, -15, -10, 0, 10, 15, 20)}
+
+
+def _cut_offsets(r, angle):
+    """(dx, dy) half-extent of the angled eyelid cut line."""
+    if r == EYE_R and angle in _CUT_DXY:
+        return _CUT_DXY[angle]
+    return _cut_offset(r, angle)
+
+
+def _erase_polygon(img, layer, ox, oy, poly):
+    """Clear poly, given in img coordinates, from a layer placed at (ox, oy).
+
+    Pillow's polygon fill is not exactly translation invariant, a sloped edge
+    can land one pixel off once shifted onto the layer. So the polygon is
+    rasterised at its real position on a cheap L mask and cropped to the layer.
+    """
+    mask = Image.new('L', img.size, 0)
+    ImageDraw.Draw(mask).polygon(poly, fill=255)
+    box = (ox, oy, ox + layer.width, oy + layer.height)
+    layer.paste((0, 0, 0, 0), (0, 0, layer.width, layer.height), mask.crop(box))
+
+
 def _draw_eye_half_top(img, cx, cy, r=EYE_R, angle=-15):
     """Half-closed eye – flat/angled bottom, open top. For sad/droopy looks.
     Draws full eye then masks bottom portion with an angled cut."""
     # Draw full eye on temp layer
-    temp = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    _draw_eye(temp, cx, cy, r)
-    # Create angled mask – keep top portion
-    mask = Image.new('L', img.size, 255)
-    md = ImageDraw.Draw(mask)
-    # Angled cut line across the eye
+    temp, ox, oy = _layer(img, cx, cy, r, r)
+    _draw_eye(temp, cx - ox, cy - oy, r)
+    # Angled cut line across the eye – keep top portion
     cut_y = cy + int(r * 0.15)
-    angle_rad = math.radians(angle)
-    dx = int(r * 1.5 * math.cos(angle_rad))
-    dy = int(r * 1.5 * math.sin(angle_rad))
-    # Fill below the cut with black (remove)
+    dx, dy = _cut_offsets(r, angle)
+    # Erase below the cut straight on the layer
     poly = [
         (cx - dx, cut_y - dy),
         (cx + dx, cut_y + dy),
         (cx + dx, cy + r + 10),
         (cx - dx, cy + r + 10),
     ]
-    md.polygon(poly, fill=0)
-    # Apply mask
-    r_c, g_c, b_c, a_c = temp.split()
-    a_c = Image.composite(a_c, Image.new('L', img.size, 0), mask)
-    temp = Image.merge('RGBA', (r_c, g_c, b_c, a_c))
-    img.alpha_composite(temp)
+    _erase_polygon(img, temp, ox, oy, poly)
+    img.alpha_composite(temp, (ox, oy))
 
 
 def _draw_eye_half_bottom(img, cx, cy, r=EYE_R, angle=15):
     """Half-closed eye – flat/angled top, open bottom. Angry/glaring look.
     Like eyelids pushed down from above."""
-    temp = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    _draw_eye(temp, cx, cy, r)
-    mask = Image.new('L', img.size, 255)
-    md = ImageDraw.Draw(mask)
+    temp, ox, oy = _layer(img, cx, cy, r, r)
+    _draw_eye(temp, cx - ox, cy - oy, r)
     cut_y = cy - int(r * 0.15)
-    angle_rad = math.radians(angle)
-    dx = int(r * 1.5 * math.cos(angle_rad))
-    dy = int(r * 1.5 * math.sin(angle_rad))
+    dx, dy = _cut_offsets(r, angle)
     poly = [
         (cx - dx, cut_y + dy),
         (cx + dx, cut_y - dy),
         (cx + dx, cy - r - 10),
         (cx - dx, cy - r - 10),
     ]
-    md.polygon(poly, fill=0)
-    r_c, g_c, b_c, a_c = temp.split()
-    a_c = Image.composite(a_c, Image.new('L', img.size, 0), mask)
-    temp = Image.merge('RGBA', (r_c, g_c, b_c, a_c))
-    img.alpha_composite(temp)
+    _erase_polygon(img, temp, ox, oy, poly)
+    img.alpha_composite(temp, (ox, oy))
 
 
 def _draw_arc_eye(img, cx, cy, r=EYE_R):
     """Curved crescent arc eye – for sleep / grateful (like ⇀ or ↼)."""
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     bbox = [cx - r, cy - int(r * 0.6), cx + r, cy + int(r * 0.6)]
     draw.arc(bbox, 200, 340, fill=CYAN, width=max(5, int(r * 0.22)))
     # Add subtle lighter inner arc
@@ -142,7 +179,7 @@ def _draw_line_eye(img, cx, cy, w=None):
     """Thin line eye – fully closed / flat."""
     if w is None:
         w = int(EYE_R * 0.9)
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     draw.line([cx - w, cy, cx + w, cy], fill=CYAN, width=4)
 
 
@@ -150,7 +187,7 @@ def _draw_x_eye(img, cx, cy, r=None):
     """X-shaped eye – broken."""
     if r is None:
         r = int(EYE_R * 0.6)
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     draw.line([cx - r, cy - r, cx + r, cy + r], fill=CYAN, width=5)
     draw.line([cx - r, cy + r, cx + r, cy - r], fill=CYAN, width=5)
 
@@ -159,7 +196,7 @@ def _draw_hash_eye(img, cx, cy, r=None):
     """# shaped eye – debug."""
     if r is None:
         r = int(EYE_R * 0.55)
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     w = 4
     draw.line([cx - r, cy - r * 0.45, cx + r, cy - r * 0.45], fill=CYAN, width=w)
     draw.line([cx - r, cy + r * 0.45, cx + r, cy + r * 0.45], fill=CYAN, width=w)
@@ -171,7 +208,7 @@ def _draw_heart_eye(img, cx, cy, s=None):
     """Heart-shaped eye with cyan gradient fill."""
     if s is None:
         s = int(EYE_R * 1.1)
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     bump = s * 0.44
     # Two bumps + triangle for heart shape
     # Outer cyan
@@ -201,7 +238,7 @@ def _draw_heart_eye(img, cx, cy, s=None):
 def _draw_tear_eye(img, cx, cy, r=EYE_R):
     """Eye with tear drops – for broken/crying face."""
     _draw_eye(img, cx, cy, r)
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     # Tear bubbles below the eye
     tr = int(r * 0.28)
     _circle(draw, cx - int(r * 0.45), cy + int(r * 0.85), tr, CYAN_LIGHT)
@@ -214,40 +251,32 @@ def _draw_tear_eye(img, cx, cy, r=EYE_R):
 
 def _draw_smile(img, cx, cy, rx=MOUTH_RX, ry=MOUTH_RY):
     """Smile: half-ellipse, round on bottom, flat top. Cyan with lighter centre."""
-    temp = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(temp)
+    temp, ox, oy = _layer(img, cx, cy, rx, ry)
+    cx, cy = cx - ox, cy - oy
+    draw = _draw(temp)
     # Outer cyan
     _ellipse(draw, cx, cy, rx, ry, CYAN)
     # Inner lighter
     _ellipse(draw, cx, cy - int(ry * 0.1), int(rx * 0.6), int(ry * 0.55), CYAN_LIGHT)
-    # Mask out top half
-    mask = Image.new('L', img.size, 255)
-    md = ImageDraw.Draw(mask)
-    md.rectangle([0, 0, SIZE, cy], fill=0)
-    r_c, g_c, b_c, a_c = temp.split()
-    a_c = Image.composite(a_c, Image.new('L', img.size, 0), mask)
-    temp = Image.merge('RGBA', (r_c, g_c, b_c, a_c))
-    img.alpha_composite(temp)
+    # Erase top half
+    draw.rectangle([0, 0, temp.width, cy], fill=(0, 0, 0, 0))
+    img.alpha_composite(temp, (ox, oy))
 
 
 def _draw_frown(img, cx, cy, rx=MOUTH_RX, ry=MOUTH_RY):
     """Frown: half-ellipse, round on top, flat bottom."""
-    temp = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(temp)
+    temp, ox, oy = _layer(img, cx, cy, rx, ry)
+    cx, cy = cx - ox, cy - oy
+    draw = _draw(temp)
     _ellipse(draw, cx, cy, rx, ry, CYAN)
     _ellipse(draw, cx, cy + int(ry * 0.1), int(rx * 0.6), int(ry * 0.55), CYAN_LIGHT)
-    mask = Image.new('L', img.size, 255)
-    md = ImageDraw.Draw(mask)
-    md.rectangle([0, cy, SIZE, SIZE], fill=0)
-    r_c, g_c, b_c, a_c = temp.split()
-    a_c = Image.composite(a_c, Image.new('L', img.size, 0), mask)
-    temp = Image.merge('RGBA', (r_c, g_c, b_c, a_c))
-    img.alpha_composite(temp)
+    draw.rectangle([0, cy, temp.width, temp.height], fill=(0, 0, 0, 0))
+    img.alpha_composite(temp, (ox, oy))
 
 
 def _draw_flat_mouth(img, cx, cy, w=MOUTH_RX):
     """Flat line mouth."""
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     draw.line([cx - w, cy, cx + w, cy], fill=CYAN, width=4)
 
 
@@ -255,7 +284,7 @@ def _draw_open_mouth(img, cx, cy, r=None):
     """Small open 'o' mouth."""
     if r is None:
         r = int(MOUTH_RY * 0.6)
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     _circle(draw, cx, cy, r, CYAN)
     _circle(draw, cx, cy, int(r * 0.5), CYAN_LIGHT)
 
@@ -314,7 +343,7 @@ def _face_angry(img):
     _draw_frown(img, CX, MOUTH_Y, rx=int(MOUTH_RX * 0.8), ry=int(MOUTH_RY * 0.8))
 
 def _face_cool(img):
-    draw = ImageDraw.Draw(img)
+    draw = _draw(img)
     # Large sunglasses – dark filled with cyan frame
     lens_w = int(EYE_R * 1.35)
     lens_h = int(EYE_R * 0.95)
@@ -476,18 +505,79 @@ def create_face(name, draw_fn, size=SIZE):
     return img
 
 
-def generate_all_faces(output_dir='.'):
+def _to_palette(img):
+    """Lossless indexed copy of an RGBA face, or the face itself if it has more than 256 colours.
+
+    The blurred edges only add a few hundred distinct RGBA values, so most
+    faces fit an 8-bit palette exactly and save at about half the size.
+    """
+    data = img.tobytes()
+    clear = b'\0\0\0\0'
+    # fully transparent pixels all look the same, don't spend palette entries on their RGB
+    pixels = [px if px[3] else clear for px in (data[i:i + 4] for i in range(0, len(data), 4))]
+    index = {}
+    for px in pixels:
+        if px not in index:
+            if len(index) == 256:
+                return img
+            index[px] = len(index)
+
+    indexed = Image.frombytes('P', img.size, bytes(index[px] for px in pixels))
+    indexed.putpalette(b''.join(index), rawmode='RGBA')
+    return indexed
+
+
+def _render_one(job):
+    name, output_dir = job
+    img = create_face(name, FACES[name][0])
+    _to_palette(img).save(os.path.join(output_dir, f'{name}.png'))
+    return name
+
+
+MANIFEST = '.faces.manifest'
+
+
+def _source_hash():
+    """Hash of this generator; palette, layout and drawing code all live in this file."""
+    with open(__file__, 'rb') as fp:
+        return hashlib.blake2b(fp.read()).hexdigest()
+
+
+def _up_to_date(output_dir, digest):
+    try:
+        with open(os.path.join(output_dir, MANIFEST)) as fp:
+            if fp.read().strip() != digest:
+                return False
+    except OSError:
+        return False
+    return all(os.path.exists(os.path.join(output_dir, f'{name}.png')) for name in FACES)
+
+
+def generate_all_faces(output_dir='.', force=False):
     os.makedirs(output_dir, exist_ok=True)
+    digest = _source_hash()
+    if not force and _up_to_date(output_dir, digest):
+        print(f"Face images in {output_dir}/ are up to date.")
+        return
     print(f"Generating face images in {output_dir}/...")
-    for name, (draw_fn, desc) in FACES.items():
-        img = create_face(name, draw_fn)
-        output_path = os.path.join(output_dir, f'{name}.png')
-        img.save(output_path)
-        print(f"  ✓ Created {name}.png – {desc}")
+    jobs = [(name, output_dir) for name in FACES]
+    try:
+        # every face is independent CPU work in Pillow, spread them over the cores
+        with ProcessPoolExecutor() as ex:
+            done = list(ex.map(_render_one, jobs))
+    except (OSError, NotImplementedError):
+        # no working multiprocessing here (e.g. no /dev/shm), Pillow drops the GIL in its C code
+        with ThreadPoolExecutor() as ex:
+            done = list(ex.map(_render_one, jobs))
+    for name in done:
+        print(f"  ✓ Created {name}.png – {FACES[name][1]}")
+    with open(os.path.join(output_dir, MANIFEST), 'w') as fp:
+        fp.write(digest + '\n')
     print(f"\nGenerated {len(FACES)} face images!")
     print(f"Images are {SIZE}×{SIZE} PNG with transparent backgrounds.")
 
 if __name__ == '__main__':
     import sys
-    output_dir = sys.argv[1] if len(sys.argv) > 1 else '.'
-    generate_all_faces(output_dir)
+    args = [a for a in sys.argv[1:] if a != '--force']
+    output_dir = args[0] if args else '.'
+    generate_all_faces(output_dir, force='--force' in sys.argv[1:])
@@ -3,6 +3,7 @@ import os
 import sys
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
 import pwnagotchi.ui.fonts as fonts
@@ -17,6 +18,14 @@ LCD_LIB_SEARCH_PATHS = [
 ]
 
 
+# Pillow >= 9.1 (and Pillow-SIMD 9) moved the filters to Image.Resampling
+LANCZOS = getattr(Image, 'Resampling', Image).LANCZOS
+ROTATE_180 = getattr(Image, 'Transpose', Image).ROTATE_180
+
+# Above this fraction of the screen a changed area is sent as a full frame
+PARTIAL_MAX_AREA = 0.6
+
+
 class Waveshare1inch28(DisplayImpl):
     """
     Waveshare 1.28" Round LCD Display Driver
@@ -25,11 +34,16 @@ class Waveshare1inch28(DisplayImpl):
     - Interface: SPI
     """
 
+    # Library directory found by _find_lcd_library, shared by later instances in this process
+    _lib_path = None
+
     def __init__(self, config):
         super(Waveshare1inch28, self).__init__(config, 'waveshare1inch28')
         self._display = None
         self.width = 240
         self.height = 240
+        self._last_hash = None
+        self._last_pix = None
 
     def layout(self):
         """Set up the layout for the round display - matching pygame_display.py"""
@@ -73,6 +87,10 @@ class Waveshare1inch28(DisplayImpl):
         Raises:
             ImportError: If the library is not found in any search path
         """
+        cached = Waveshare1inch28._lib_path
+        if cached and os.path.isdir(cached):
+            return cached
+
         # Build search paths: configured paths + dynamic home-based paths
         search_paths = list(LCD_LIB_SEARCH_PATHS)
         for subdir in ('pwnagotchi', 'app'):
@@ -83,6 +101,7 @@ class Waveshare1inch28(DisplayImpl):
         for path in search_paths:
             if os.path.isfile(os.path.join(path, 'LCD_1inch28.py')):
                 logging.info(f"Found LCD library at: {path}")
+                Waveshare1inch28._lib_path = path
                 return path
 
         raise ImportError(
@@ -129,33 +148,79 @@ class Waveshare1inch28(DisplayImpl):
         Render a PIL Image to the physical display.
 
         Args:
-            canvas: PIL Image object (240x240) to display
+            canvas: PIL Image object (240x240) to display. View always produces
+                    240x240 RGB frames, the conversion and resize below are only
+                    a safety net for other callers and never run on that path.
         """
         if self._display is None:
             logging.warning("Display not initialized, skipping render")
             return
 
         try:
+            # Frames are often identical to the last one sent, skip the conversion and SPI transfer
+            frame_hash = hash((canvas.mode, canvas.size, canvas.tobytes()))
+            if frame_hash == self._last_hash:
+                return
+
             # Ensure canvas is RGB mode
             if canvas.mode != 'RGB':
                 canvas = canvas.convert('RGB')
 
             # Ensure correct size
             if canvas.size != (self.width, self.height):
-                canvas = canvas.resize((self.width, self.height), Image.LANCZOS)
-
-            # Rotate 180 degrees (display is typically upside down)
-            canvas = canvas.rotate(180)
+                canvas = canvas.resize((self.width, self.height), LANCZOS)
 
-            # Send to display
-            self._display.ShowImage(canvas)
+            spi = getattr(self._display, 'SPI', None)
+            if spi is not None and hasattr(spi, 'writebytes2'):
+                self._write_frame(spi, canvas)
+            else:
+                # Rotate 180 degrees (display is typically upside down), a transpose is a
+                # plain pixel reorder with no resampling
+                self._display.ShowImage(canvas.transpose(ROTATE_180))
+            self._last_hash = frame_hash
 
         except Exception as e:
             logging.error(f"Error rendering to Waveshare display: {e}")
 
+    def _write_frame(self, spi, canvas):
+        """Send a 240x240 RGB frame to the panel, rotated 180 degrees.
+
+        Same RGB565 bytes and window as LCD_1inch28.ShowImage, but packed
+        straight into a bytes buffer and sent with writebytes2, instead of
+        building a 115200 item Python list and writing it 4 KB at a time.
+        Only the bounding box of the pixels that differ from the previous
+        frame is sent, unless it covers most of the screen anyway.
+        """
+        # reversed views do the 180 degree rotation without copying the frame
+        rgb = np.asarray(canvas)[::-1, ::-1]
+        pix = np.empty((self.height, self.width, 2), dtype=np.uint8)
+        np.bitwise_or(rgb[..., 0] & 0xF8, rgb[..., 1] >> 5, out=pix[..., 0])
+        np.bitwise_or((rgb[..., 1] << 3) & 0xE0, rgb[..., 2] >> 3, out=pix[..., 1])
+
+        x0, y0, x1, y1 = 0, 0, self.width, self.height
+        if self._last_pix is not None:
+            # compare whole pixels as uint16, reducing over the byte axis is ~30x slower
+            changed = pix.view(np.uint16)[..., 0] != self._last_pix.view(np.uint16)[..., 0]
+            rows = np.flatnonzero(changed.any(axis=1))
+            if not len(rows):
+                return
+            cols = np.flatnonzero(changed[rows[0]:rows[-1] + 1].any(axis=0))
+            if (rows[-1] + 1 - rows[0]) * (cols[-1] + 1 - cols[0]) <= PARTIAL_MAX_AREA * self.width * self.height:
+                x0, y0, x1, y1 = int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+        # forget the previous frame first, after a failed write the panel contents are unknown
+        self._last_pix = None
+        self._display.SetWindows(x0, y0, x1, y1)
+        self._display.digital_write(self._display.DC_PIN, True)
+        # writebytes2 splits the buffer into spidev bufsiz transfers itself
+        spi.writebytes2(pix[y0:y1, x0:x1].tobytes())
+        self._last_pix = pix
+
     def clear(self):
         """Clear the display to black."""
         if self._display:
+            self._last_hash = None
+            self._last_pix = None
             try:
                 self._display.clear()
             except Exception as e:
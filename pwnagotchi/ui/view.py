@@ -2,7 +2,7 @@ import _thread
 import logging
 import random
 import time
-from threading import Lock
+from threading import Event, Lock
 
 from PIL import ImageDraw
 
@@ -31,6 +31,52 @@ WHITE_MONO = 0xff
 BLACK_MONO = 0x00
 ROOT = None
 
+# Faces with an image in faces_img; each name matches its faces.<NAME> constant
+FACE_IMAGE_NAMES = (
+    'look_r',
+    'look_l',
+    'look_r_happy',
+    'look_l_happy',
+    'sleep',
+    'sleep2',
+    'awake',
+    'bored',
+    'intense',
+    'cool',
+    'happy',
+    'grateful',
+    'excited',
+    'motivated',
+    'demotivated',
+    'smart',
+    'lonely',
+    'sad',
+    'angry',
+    'friend',
+    'broken',
+    'debug',
+    'upload',
+    'upload1',
+    'upload2',
+)
+
+
+def _format_name(value):
+    # Strip any existing '>' and cursor artifacts before re-adding,
+    # since callers may feed back already-formatted values
+    value = value.replace('█', '').strip().rstrip('>')
+    return f'{value}>'
+
+
+# Labels added by View.set() to the values of the CurvedText elements
+VALUE_FORMATTERS = {
+    'channel': 'CH {}'.format,
+    'aps': 'APS {}'.format,
+    'uptime': 'UP {}'.format,
+    'shakes': 'PWND {}'.format,
+    'name': _format_name,
+}
+
 
 class View(object):
     def __init__(self, config, impl, state=None):
@@ -38,6 +84,8 @@ class View(object):
 
         # setup faces from the configuration in case the user customized them
         faces.load_from_config(config['ui']['faces'])
+        # built once here, after the config may have overridden the face strings
+        self._face_names = {getattr(faces, name.upper()): name for name in FACE_IMAGE_NAMES}
 
         self._agent = None
         self._render_cbs = []
@@ -45,6 +93,13 @@ class View(object):
         self._canvas = None
         self._frozen = False
         self._lock = Lock()
+        # publishing (web frame, render callbacks) runs outside _lock under its own lock,
+        # _frame_seq/_published_seq keep an older frame from overwriting a newer one
+        self._publish_lock = Lock()
+        self._frame_seq = 0
+        self._published_seq = 0
+        # set by set(), wakes _refresh_handler instead of polling at ui.fps
+        self._dirty = Event()
         self._voice = Voice(lang=config['main']['lang'])
         self._implementation = impl
         self._layout = impl.layout()
@@ -83,6 +138,9 @@ class View(object):
             for key, value in state.items():
                 self._state.set(key, value)
 
+        # decode the face images off the drawing path so the first mood change doesn't stall
+        _thread.start_new_thread(faces_img.preload_all, ((160, 160),))
+
         plugins.on('ui_setup', self)
 
         if config['ui']['fps'] > 0.0:
@@ -102,9 +160,11 @@ class View(object):
 
     def add_element(self, key, elem):
         self._state.add_element(key, elem)
+        self._dirty.set()
 
     def remove_element(self, key):
         self._state.remove_element(key)
+        self._dirty.set()
 
     def width(self):
         return self._width
@@ -122,9 +182,12 @@ class View(object):
     def _refresh_handler(self):
         delay = 1.0 / self._config['ui']['fps']
         while True:
+            # sleep until something is set, then redraw at most once per 1/fps
+            self._dirty.wait()
+            self._dirty.clear()
             try:
-                name = self._state.get('name')
-                self.set('name', name.rstrip('█').strip() if '█' in name else (name + ' █'))
+                # picks up values set without an update() call, e.g. by plugins;
+                # returns without drawing when update() already drew them
                 self.update()
             except Exception as e:
                 logging.warning("non fatal error while updating view: %s" % e)
@@ -133,19 +196,9 @@ class View(object):
 
     def set(self, key, value):
         # Format values for CurvedText components that need labels
-        if key == 'channel':
-            value = f'CH {value}'
-        elif key == 'aps':
-            value = f'APS {value}'
-        elif key == 'uptime':
-            value = f'UP {value}'
-        elif key == 'shakes':
-            value = f'PWND {value}'
-        elif key == 'name':
-            # Strip any existing '>' and cursor artifacts before re-adding,
-            # since _refresh_handler feeds back already-formatted values
-            value = value.replace('█', '').strip().rstrip('>')
-            value = f'{value}>'
+        fmt = VALUE_FORMATTERS.get(key)
+        if fmt is not None:
+            value = fmt(value)
 
         # Special handling for face to support both text and images (including APNG animation)
         if key == 'face' and isinstance(value, str):
@@ -155,11 +208,11 @@ class View(object):
                 frames = faces_img.get_face_frames(face_name, size=(160, 160))
                 if frames:
                     if hasattr(face_component, 'set_frames'):
-                        face_component.set_frames(frames)
+                        face_component.set_frames(frames, faces_img.get_face_layers(face_name, size=(160, 160)))
                         if len(frames) > 1:
-                            logging.info(f"[FACE] ✓ Animated face: {face_name} ({len(frames)} frames)")
+                            logging.debug("[FACE] ✓ Animated face: %s (%d frames)", face_name, len(frames))
                         else:
-                            logging.info(f"[FACE] ✓ Static face: {face_name}")
+                            logging.debug("[FACE] ✓ Static face: %s", face_name)
                     else:
                         # Fallback for components without animation support
                         face_component.image = frames[0]
@@ -168,40 +221,14 @@ class View(object):
                     if hasattr(face_component, 'set_frames'):
                         face_component.set_frames([])
                     face_component.image = None
-                    logging.debug(f"[FACE] No image for '{face_name}', falling back to text")
+                    logging.debug("[FACE] No image for '%s', falling back to text", face_name)
 
         self._state.set(key, value)
+        self._dirty.set()
 
     def _get_face_name_from_value(self, face_value):
         """Map a face text value to its name for image lookup."""
-        face_map = {
-            faces.LOOK_R: 'look_r',
-            faces.LOOK_L: 'look_l',
-            faces.LOOK_R_HAPPY: 'look_r_happy',
-            faces.LOOK_L_HAPPY: 'look_l_happy',
-            faces.SLEEP: 'sleep',
-            faces.SLEEP2: 'sleep2',
-            faces.AWAKE: 'awake',
-            faces.BORED: 'bored',
-            faces.INTENSE: 'intense',
-            faces.COOL: 'cool',
-            faces.HAPPY: 'happy',
-            faces.GRATEFUL: 'grateful',
-            faces.EXCITED: 'excited',
-            faces.MOTIVATED: 'motivated',
-            faces.DEMOTIVATED: 'demotivated',
-            faces.SMART: 'smart',
-            faces.LONELY: 'lonely',
-            faces.SAD: 'sad',
-            faces.ANGRY: 'angry',
-            faces.FRIEND: 'friend',
-            faces.BROKEN: 'broken',
-            faces.DEBUG: 'debug',
-            faces.UPLOAD: 'upload',
-            faces.UPLOAD1: 'upload1',
-            faces.UPLOAD2: 'upload2',
-        }
-        return face_map.get(face_value)
+        return self._face_names.get(face_value)
 
     def get(self, key):
         return self._state.get(key)
@@ -441,19 +468,31 @@ class View(object):
 
             state = self._state
             changes = state.changes(ignore=self._ignore_changes)
-            if force or len(changes):
-                # Create RGB canvas with black background for IPS display
-                self._canvas = Image.new('RGB', (self._width, self._height), BLACK)
-                drawer = ImageDraw.Draw(self._canvas)
+            if not (force or len(changes)):
+                return
 
-                plugins.on('ui_update', self)
+            # Create RGB canvas with black background for IPS display
+            canvas = Image.new('RGB', (self._width, self._height), BLACK)
+            drawer = ImageDraw.Draw(canvas)
+            self._canvas = canvas
 
-                for key, lv in state.items():
-                    lv.draw(self._canvas, drawer)
+            plugins.on('ui_update', self)
 
-                web.update_frame(self._canvas)
+            for key, lv in state.items():
+                lv.draw(canvas, drawer)
+
+            self._state.reset()
+            self._frame_seq += 1
+            seq = self._frame_seq
+
+        # the canvas is never drawn on again, so it can be published without holding
+        # _lock and the next update() can compose while the callbacks run
+        with self._publish_lock:
+            if seq < self._published_seq:
+                return
+            self._published_seq = seq
 
-                for cb in self._render_cbs:
-                    cb(self._canvas)
+            web.update_frame(canvas)
 
-                self._state.reset()
+            for cb in self._render_cbs:
+                cb(canvas)
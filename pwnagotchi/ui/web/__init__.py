@@ -5,11 +5,24 @@ frame_path = '/var/tmp/pwnagotchi/pwnagotchi.png'
 frame_format = 'PNG'
 frame_ctype = 'image/png'
 frame_lock = Lock()
+# latest frame not yet written to frame_path
+frame_pending = None
 
 
 def update_frame(img):
-    global frame_lock, frame_path, frame_format
+    # only keep a reference, most frames are never looked at so the PNG
+    # encoding is deferred to flush_frame() when a web client asks for it
+    global frame_lock, frame_pending
+    with frame_lock:
+        frame_pending = img
+
+
+def flush_frame():
+    # write the latest frame to frame_path, the caller must hold frame_lock
+    global frame_path, frame_format, frame_pending
+    if frame_pending is None:
+        return
     if not os.path.exists(os.path.dirname(frame_path)):
         os.makedirs(os.path.dirname(frame_path))
-    with frame_lock:
-        img.save(frame_path, format=frame_format)
+    frame_pending.save(frame_path, format=frame_format)
+    frame_pending = None
@@ -75,11 +75,11 @@ class Handler:
 
     def display_image(self):
         """Serve the current canvas image"""
-        canvas_path = '/tmp/pwnagotchi_canvas.png'
-        if os.path.exists(canvas_path):
-            return send_file(canvas_path, mimetype='image/png', max_age=0)
-        else:
-            abort(404)
+        with web.frame_lock:
+            web.flush_frame()
+            if os.path.exists(web.frame_path):
+                return send_file(web.frame_path, mimetype='image/png', max_age=0)
+        abort(404)
 
     def display_viewer(self):
         """Serve the display viewer HTML page"""
@@ -240,4 +240,5 @@ class Handler:
     # serve the PNG file with the display image
     def ui(self):
         with web.frame_lock:
+            web.flush_frame()
             return send_file(web.frame_path, mimetype='image/png')
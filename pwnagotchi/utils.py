@@ -306,9 +306,26 @@ def secs_to_hhmmss(secs):
     return '%02d:%02d:%02d' % (hours, mins, secs)
 
 
+# path -> (directory mtime, number of captures)
+_handshake_counts = {}
+
+
 def total_unique_handshakes(path):
+    # adding or removing a capture changes the directory mtime, so the
+    # folder is only listed again when the count can actually differ
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+    cached = _handshake_counts.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
     expr = os.path.join(path, "*.pcap")
-    return len(glob.glob(expr))
+    count = len(glob.glob(expr))
+    _handshake_counts[path] = (mtime, count)
+    return count
 
 
 def iface_channels(ifname):
@@ -73,7 +73,7 @@ setup(name='pwnagotchi',
       license='GPL',
       install_requires=required,
       scripts=['bin/pwnagotchi'],
-      package_data={'pwnagotchi': ['defaults.yml', 'pwnagotchi/defaults.yml', 'locale/*/LC_MESSAGES/*.mo']},
+      package_data={'pwnagotchi': ['defaults.yml', 'pwnagotchi/defaults.yml', 'locale/*/LC_MESSAGES/*.mo', 'ui/faces_img/*.png']},
       include_package_data=True,
       packages=find_packages(),
       classifiers=[